@@ -24,10 +24,8 @@ Date: 2026-01-12
 """
 
 import sys
-import struct
 import time
-from collections import deque
-from typing import Optional
+from typing import Optional, Tuple
 from pathlib import Path
 
 import numpy as np
@@ -38,8 +36,11 @@ from PyQt6.QtWidgets import (
     QLabel, QPushButton, QComboBox, QStatusBar, QGroupBox, QSpinBox,
     QSlider, QFrame, QProgressBar, QDialog, QDialogButtonBox, QFileDialog
 )
-from PyQt6.QtCore import QTimer, Qt, pyqtSignal, QThread
-from PyQt6.QtGui import QFont, QPalette, QColor, QPainter, QPen, QBrush
+from PyQt6.QtCore import QTimer, Qt, pyqtSignal, QThread, QRectF, QPointF, QLine
+from PyQt6.QtGui import (
+    QFont, QPalette, QColor, QPainter, QPen, QBrush, QPainterPath, QStaticText,
+    QFontMetricsF
+)
 import pyqtgraph as pg
 
 # Import spine detector module
@@ -57,17 +58,31 @@ GRID_ROWS = 16
 GRID_COLS = 32
 GRID_TOTAL = GRID_ROWS * GRID_COLS  # 512
 
+# Serial port read timeout - bounds each blocking read so stop() is prompt
+SERIAL_TIMEOUT = 0.05  # seconds
+
 # Binary protocol
 SYNC_BYTE_1 = 0xAA
 SYNC_BYTE_2 = 0x55
+SYNC_PATTERN = bytes((SYNC_BYTE_1, SYNC_BYTE_2))
 HEADER_SIZE = 2
-PAYLOAD_SIZE = GRID_TOTAL * 2  # 3200 bytes (16-bit values)
+PAYLOAD_SIZE = GRID_TOTAL * 2  # 1024 bytes (16-bit values)
 FOOTER_SIZE = 4  # 2-byte checksum + CR + LF
-PACKET_SIZE = HEADER_SIZE + PAYLOAD_SIZE + FOOTER_SIZE  # 3206 bytes
+PACKET_SIZE = HEADER_SIZE + PAYLOAD_SIZE + FOOTER_SIZE  # 1030 bytes
+READ_BUFFER_SIZE = PACKET_SIZE * 4  # Preallocated serial receive buffer
+FRAME_RING_SIZE = 8  # Decoded frames buffered between reader and GUI
+
+# Top of the pressure display range (heatmap levels, pressure bar,
+# waveform axis). Samples are the firmware's 24-bit ADS1220 readings
+# shifted down to 16 bits (0-65535); anything above this saturates.
+PRESSURE_DISPLAY_MAX = 4095
 
 # Waveform history
 WAVEFORM_HISTORY_SIZE = 200  # ~8 seconds at 25 Hz
 
+# GUI pulls the newest serial frame at roughly display rate
+FRAME_POLL_INTERVAL_MS = 16
+
 # UI Colors (dark theme)
 DARK_BG = "#1e1e2e"
 DARK_SURFACE = "#313244"
@@ -79,6 +94,152 @@ ACCENT_YELLOW = "#f9e2af"
 ACCENT_ORANGE = "#fab387"
 ACCENT_PURPLE = "#cba6f7"
 
+# Heatmap colormap, low to high pressure
+HEATMAP_COLORS = np.array([
+    (0, 0, 128),      # Dark blue
+    (0, 0, 255),      # Blue
+    (0, 255, 255),    # Cyan
+    (0, 255, 0),      # Green
+    (255, 255, 0),    # Yellow
+    (255, 128, 0),    # Orange
+    (255, 0, 0),      # Red
+], dtype=np.uint8)
+HEATMAP_POSITIONS = np.linspace(0.0, 1.0, len(HEATMAP_COLORS))
+
+# One RGB entry per pressure value in the display range, built once so
+# frames are colored by a single table lookup
+HEATMAP_LUT = pg.ColorMap(HEATMAP_POSITIONS, HEATMAP_COLORS).getLookupTable(
+    nPts=PRESSURE_DISPLAY_MAX + 1
+)
+
+
+# ============================================================================
+# Style Sheets (formatted once at import)
+# ============================================================================
+
+DARK_THEME_QSS = f"""
+    QMainWindow, QWidget {{
+        background-color: {DARK_BG};
+        color: {DARK_TEXT};
+    }}
+    QGroupBox {{
+        border: 1px solid {DARK_SURFACE};
+        border-radius: 8px;
+        margin-top: 12px;
+        padding-top: 10px;
+        font-weight: bold;
+    }}
+    QGroupBox::title {{
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }}
+    QPushButton {{
+        background-color: {DARK_SURFACE};
+        border: none;
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-weight: bold;
+    }}
+    QPushButton:hover {{
+        background-color: {ACCENT_BLUE};
+        color: {DARK_BG};
+    }}
+    QPushButton:pressed {{
+        background-color: {ACCENT_GREEN};
+    }}
+    QComboBox {{
+        background-color: {DARK_SURFACE};
+        border: 1px solid {DARK_SURFACE};
+        border-radius: 4px;
+        padding: 5px;
+    }}
+    QLabel {{
+        color: {DARK_TEXT};
+    }}
+    QStatusBar {{
+        background-color: {DARK_SURFACE};
+    }}
+    QProgressBar {{
+        border: 1px solid {DARK_SURFACE};
+        border-radius: 4px;
+        background-color: {DARK_BG};
+        height: 20px;
+    }}
+    QProgressBar::chunk {{
+        background-color: {ACCENT_BLUE};
+        border-radius: 3px;
+    }}
+"""
+
+# Start/stop buttons: green when idle, red while running. Switched with the
+# "active" dynamic property so the sheet is parsed once per button.
+TOGGLE_BUTTON_QSS = f"""
+    QPushButton {{
+        background-color: {ACCENT_GREEN};
+        color: {DARK_BG};
+    }}
+    QPushButton[active="true"] {{
+        background-color: {ACCENT_RED};
+    }}
+"""
+
+GREEN_TEXT_QSS = f"color: {ACCENT_GREEN};"
+YELLOW_TEXT_QSS = f"color: {ACCENT_YELLOW};"
+GREEN_BOLD_QSS = f"color: {ACCENT_GREEN}; font-weight: bold;"
+YELLOW_BOLD_QSS = f"color: {ACCENT_YELLOW}; font-weight: bold;"
+RED_BOLD_QSS = f"color: {ACCENT_RED}; font-weight: bold;"
+
+# Feedback zone label template; filled in once per zone color by FeedbackPanel
+ZONE_LABEL_QSS = "color: {color}; font-weight: bold;"
+
+
+def set_button_active(button: QPushButton, active: bool):
+    """Switch a TOGGLE_BUTTON_QSS button between its idle and active colors."""
+    button.setProperty("active", active)
+    # Property selectors are only re-evaluated on polish
+    button.style().unpolish(button)
+    button.style().polish(button)
+
+
+# ============================================================================
+# Ring Buffer
+# ============================================================================
+
+class RingBuffer1D:
+    """
+    Fixed-capacity float32 history backed by a preallocated array.
+    
+    Every sample is also written to a shadow slot `capacity` further on,
+    so the newest `capacity` samples are always one contiguous slice.
+    """
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.data = np.zeros(2 * capacity, dtype=np.float32)
+        self.head = 0      # Next slot to write
+        self.filled = 0    # Number of valid samples
+    
+    def __len__(self) -> int:
+        return self.filled
+    
+    def push(self, value: float):
+        """Append a sample, overwriting the oldest once full."""
+        self.data[self.head] = value
+        self.data[self.head + self.capacity] = value
+        self.head = (self.head + 1) % self.capacity
+        self.filled = min(self.filled + 1, self.capacity)
+    
+    def view(self) -> np.ndarray:
+        """Samples in chronological order (oldest first), without copying."""
+        if self.filled < self.capacity:
+            return self.data[:self.filled]
+        return self.data[self.head:self.head + self.capacity]
+    
+    def clear(self):
+        self.head = 0
+        self.filled = 0
+
 
 # ============================================================================
 # Serial Reader Thread
@@ -87,7 +248,6 @@ ACCENT_PURPLE = "#cba6f7"
 class SerialReader(QThread):
     """Background thread for reading serial data."""
     
-    data_received = pyqtSignal(np.ndarray)  # Emits 40x40 numpy array
     error_occurred = pyqtSignal(str)
     
     def __init__(self, port: str, baudrate: int = 115200):
@@ -96,56 +256,70 @@ class SerialReader(QThread):
         self.baudrate = baudrate
         self.running = False
         self.serial: Optional[serial.Serial] = None
+        
+        # Single-producer frame ring. The reader decodes into the slot after
+        # the newest frame and then bumps _frame_seq to publish it; the GUI
+        # copies only the newest frame (see latest_frame), so a slow GUI
+        # drops stale frames instead of queueing them.
+        self._frames = np.zeros((FRAME_RING_SIZE, GRID_ROWS, GRID_COLS), dtype=np.uint16)
+        self._frame_seq = 0
     
     def run(self):
         """Main thread loop - reads and parses binary packets."""
         try:
-            self.serial = serial.Serial(self.port, self.baudrate, timeout=1)
+            self.serial = serial.Serial(self.port, self.baudrate, timeout=SERIAL_TIMEOUT)
             self.running = True
-            buffer = bytearray()
+            
+            # Unread bytes live in buffer[head:tail]; the buffer is never
+            # reallocated, only compacted when the tail reaches the end.
+            buffer = bytearray(READ_BUFFER_SIZE)
+            view = memoryview(buffer)
+            head = tail = 0
+            
+            # Once packets parse back-to-back the stream is locked to the
+            # packet boundary and each pass reads exactly one packet
+            locked = False
             
             while self.running:
-                # Read available data
-                if self.serial.in_waiting:
-                    buffer.extend(self.serial.read(self.serial.in_waiting))
+                # Block until the rest of a packet arrives (bounded by the
+                # port timeout); while resyncing also drain anything waiting
+                size = PACKET_SIZE - (tail - head)
+                if not locked:
+                    size = max(size, self.serial.in_waiting)
+                if tail + size > READ_BUFFER_SIZE and head > 0:
+                    view[:tail - head] = view[head:tail]
+                    tail -= head
+                    head = 0
+                size = min(size, READ_BUFFER_SIZE - tail)
+                tail += self.serial.readinto(view[tail:tail + size])
                 
                 # Look for sync bytes
-                while len(buffer) >= PACKET_SIZE:
+                while tail - head >= PACKET_SIZE:
                     # Find sync pattern
-                    sync_idx = -1
-                    for i in range(len(buffer) - 1):
-                        if buffer[i] == SYNC_BYTE_1 and buffer[i+1] == SYNC_BYTE_2:
-                            sync_idx = i
-                            break
+                    sync_idx = self._find_sync(buffer, head, tail)
                     
                     if sync_idx == -1:
-                        buffer = buffer[-1:]
+                        head = tail - 1
+                        locked = False
                         break
                     
-                    if sync_idx > 0:
-                        buffer = buffer[sync_idx:]
+                    if sync_idx != head:
+                        locked = False
+                    head = sync_idx
                     
-                    if len(buffer) < PACKET_SIZE:
+                    if tail - head < PACKET_SIZE:
                         break
                     
-                    packet = buffer[:PACKET_SIZE]
-                    buffer = buffer[PACKET_SIZE:]
-                    
-                    payload = packet[HEADER_SIZE:HEADER_SIZE + PAYLOAD_SIZE]
-                    
-                    expected_checksum = struct.unpack('<H', 
-                        packet[HEADER_SIZE + PAYLOAD_SIZE:HEADER_SIZE + PAYLOAD_SIZE + 2])[0]
-                    actual_checksum = sum(payload) & 0xFFFF
+                    slot = self._frames[self._frame_seq % FRAME_RING_SIZE]
+                    valid = self._parse_packet(view[head:head + PACKET_SIZE], slot)
+                    head += PACKET_SIZE
+                    locked = valid
                     
-                    if expected_checksum != actual_checksum:
-                        continue
-                    
-                    values = struct.unpack(f'<{GRID_TOTAL}H', payload)
-                    grid_data = np.array(values, dtype=np.uint16).reshape(GRID_ROWS, GRID_COLS)
-                    
-                    self.data_received.emit(grid_data)
+                    if valid:
+                        self._frame_seq += 1
                 
-                time.sleep(0.001)
+                if head == tail:
+                    head = tail = 0
                 
         except Exception as e:
             self.error_occurred.emit(str(e))
@@ -153,6 +327,45 @@ class SerialReader(QThread):
             if self.serial and self.serial.is_open:
                 self.serial.close()
     
+    def latest_frame(self, seen_seq: int) -> Tuple[int, Optional[np.ndarray]]:
+        """
+        Get the newest decoded frame if one arrived after `seen_seq`.
+        
+        Returns:
+            (seq, frame copy), or (seen_seq, None) if there is nothing new
+        """
+        seq = self._frame_seq
+        if seq == seen_seq:
+            return (seen_seq, None)
+        return (seq, self._frames[(seq - 1) % FRAME_RING_SIZE].copy())
+    
+    @staticmethod
+    def _find_sync(buffer: bytearray, start: int, end: int) -> int:
+        """Return the index of the first sync pattern in buffer[start:end], or -1."""
+        return buffer.find(SYNC_PATTERN, start, end)
+    
+    def _parse_packet(self, packet, out: np.ndarray) -> bool:
+        """
+        Validate and decode one packet starting at the sync bytes.
+        
+        The grid is written into `out`, a preallocated (GRID_ROWS, GRID_COLS)
+        uint16 array. Returns False, leaving `out` untouched, if the
+        checksum does not match.
+        """
+        checksum_start = HEADER_SIZE + PAYLOAD_SIZE
+        expected_checksum = int.from_bytes(packet[checksum_start:checksum_start + 2], 'little')
+        payload = np.frombuffer(packet, dtype=np.uint8, count=PAYLOAD_SIZE, offset=HEADER_SIZE)
+        actual_checksum = int(payload.sum(dtype=np.uint32)) & 0xFFFF
+        
+        if expected_checksum != actual_checksum:
+            return False
+        
+        # Reinterpret the little-endian payload in place - no per-sample
+        # Python ints - then copy it out of the read buffer.
+        values = np.frombuffer(packet, dtype='<u2', count=GRID_TOTAL, offset=HEADER_SIZE)
+        np.copyto(out, values.reshape(GRID_ROWS, GRID_COLS))
+        return True
+    
     def stop(self):
         """Stop the reader thread."""
         self.running = False
@@ -204,7 +417,7 @@ class CalibrationDialog(QDialog):
         # Status
         self.status_label = QLabel("Ready to calibrate")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.status_label.setStyleSheet(f"color: {ACCENT_YELLOW}; font-weight: bold;")
+        self.status_label.setStyleSheet(YELLOW_BOLD_QSS)
         layout.addWidget(self.status_label)
         
         # Buttons
@@ -212,7 +425,7 @@ class CalibrationDialog(QDialog):
         
         self.record_btn = QPushButton("▶ Start Recording")
         self.record_btn.clicked.connect(self._toggle_recording)
-        self.record_btn.setStyleSheet(f"background-color: {ACCENT_GREEN}; color: {DARK_BG};")
+        self.record_btn.setStyleSheet(TOGGLE_BUTTON_QSS)
         btn_layout.addWidget(self.record_btn)
         
         self.cancel_btn = QPushButton("Cancel")
@@ -235,28 +448,28 @@ class CalibrationDialog(QDialog):
         self._frame_count = 0
         self.detector.start_calibration()
         self.record_btn.setText("⏹ Stop Recording")
-        self.record_btn.setStyleSheet(f"background-color: {ACCENT_RED}; color: {DARK_BG};")
+        set_button_active(self.record_btn, True)
         self.status_label.setText("Recording... Drag finger along spine!")
-        self.status_label.setStyleSheet(f"color: {ACCENT_GREEN}; font-weight: bold;")
+        self.status_label.setStyleSheet(GREEN_BOLD_QSS)
     
     def _stop_recording(self):
         self._is_recording = False
         self.record_btn.setText("▶ Start Recording")
-        self.record_btn.setStyleSheet(f"background-color: {ACCENT_GREEN}; color: {DARK_BG};")
+        set_button_active(self.record_btn, False)
         
         # Finalize calibration
         success, message = self.detector.finalize_calibration()
         
         if success:
             self.status_label.setText(f"✓ {message}")
-            self.status_label.setStyleSheet(f"color: {ACCENT_GREEN}; font-weight: bold;")
+            self.status_label.setStyleSheet(GREEN_BOLD_QSS)
             self.progress_bar.setValue(100)
             
             # Auto-accept after success
             QTimer.singleShot(1500, self._accept_calibration)
         else:
             self.status_label.setText(f"✗ {message}")
-            self.status_label.setStyleSheet(f"color: {ACCENT_RED}; font-weight: bold;")
+            self.status_label.setStyleSheet(RED_BOLD_QSS)
             self.progress_bar.setValue(0)
     
     def _accept_calibration(self):
@@ -269,15 +482,116 @@ class CalibrationDialog(QDialog):
             self.detector.add_calibration_frame(frame)
             self._frame_count += 1
             
-            # Update progress (aim for ~50 frames)
-            progress = min(100, int(self._frame_count / 50 * 100))
-            self.progress_bar.setValue(progress)
+            # Update progress (aim for ~50 frames, 2% each); it holds at
+            # 100 after that, so stop touching the bar
+            if self._frame_count <= 50:
+                self.progress_bar.setValue(self._frame_count * 2)
 
 
 # ============================================================================
 # Landmark Overlay Widget
 # ============================================================================
 
+class LandmarkHighlight(pg.GraphicsObject):
+    """Highlighted landmark dots, drawn above the cached LandmarkOverlay."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # [(pen, brush, [rect, ...]), ...] in draw order
+        self._groups = []
+        self._bounds = QRectF()
+    
+    def set_dots(self, groups: list):
+        bounds = QRectF()
+        for _, _, rects in groups:
+            for rect in rects:
+                bounds = bounds.united(rect)
+        
+        # Only the dots themselves (plus pen width) need repainting
+        self.prepareGeometryChange()
+        self._bounds = bounds.adjusted(-1, -1, 1, 1) if groups else QRectF()
+        self._groups = groups
+        self.update()
+    
+    def boundingRect(self):
+        return self._bounds
+    
+    def paint(self, painter, option, widget):
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        for pen, brush, rects in self._groups:
+            path = QPainterPath()
+            path.setFillRule(Qt.FillRule.WindingFill)
+            for rect in rects:
+                path.addEllipse(rect)
+            painter.setPen(pen)
+            painter.setBrush(brush)
+            painter.drawPath(path)
+
+
+class LandmarkLabels(pg.GraphicsObject):
+    """Level labels for the spinous processes, drawn above the highlight."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # [(col, row, level), ...]
+        self._labels = []
+        self._label_pen = QPen(QColor(DARK_TEXT))
+        self._label_font = QFont()
+        self._label_font.setPointSize(7)
+        # Level -> laid-out label, so text shaping happens once per level
+        self._static_text = {}
+        # Fitted to the labels in set_landmarks; they run past the grid edge
+        self._bounds = QRectF()
+        
+        # Labels only change with the calibration, like the overlay itself
+        self.setCacheMode(pg.QtWidgets.QGraphicsItem.CacheMode.DeviceCoordinateCache)
+    
+    def _get_static_text(self, level: str) -> QStaticText:
+        text = self._static_text.get(level)
+        if text is None:
+            text = QStaticText(level)
+            text.setTextFormat(Qt.TextFormat.PlainText)
+            self._static_text[level] = text
+        return text
+    
+    def set_landmarks(self, landmarks: list):
+        self._labels = [
+            (lm.col, lm.row, lm.level) for lm in landmarks
+            if lm.landmark_type == 'spinous'
+        ]
+        
+        # Text is drawn from the baseline at (col + 3, row + 2)
+        metrics = QFontMetricsF(self._label_font)
+        bounds = QRectF()
+        for col, row, level in self._labels:
+            bounds = bounds.united(QRectF(
+                int(col + 3), int(row + 2) - metrics.ascent(),
+                metrics.horizontalAdvance(level), metrics.height()
+            ))
+        
+        self.prepareGeometryChange()
+        self._bounds = QRectF() if bounds.isNull() else bounds.adjusted(-1, -1, 1, 1)
+        self.update()
+    
+    def boundingRect(self):
+        return self._bounds
+    
+    def paint(self, painter, option, widget):
+        if not self._labels:
+            return
+        
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(self._label_pen)
+        painter.setFont(self._label_font)
+        # Static text is placed by its top-left corner, not the baseline
+        ascent = QFontMetricsF(self._label_font, painter.device()).ascent()
+        for col, row, level in self._labels:
+            painter.drawStaticText(
+                QPointF(int(col + 3), int(row + 2) - ascent),
+                self._get_static_text(level)
+            )
+
+
 class LandmarkOverlay(pg.GraphicsObject):
     """Overlay for drawing spinal landmarks on heatmap."""
     
@@ -285,20 +599,159 @@ class LandmarkOverlay(pg.GraphicsObject):
         super().__init__(parent)
         self.landmarks: list = []
         self.spine_line = None
-        self.show_labels = True
+        self._spine_qline = None
+        self._landmarks_sig = None
         self.highlight_landmark = None
+        
+        # Pens, brushes and fonts never change, so build them once here
+        # rather than on every paint
+        self._spine_pen = QPen(QColor(ACCENT_PURPLE))
+        self._spine_pen.setWidth(2)
+        self._spine_pen.setStyle(Qt.PenStyle.DashLine)
+        # (is_spinous, is_highlighted) -> (pen, brush, size), in draw order
+        # so highlighted dots land on top
+        self._styles = {
+            (True, False): self._make_style(ACCENT_BLUE, 3),
+            (False, False): self._make_style(ACCENT_ORANGE, 2),
+            (True, True): self._make_style(ACCENT_GREEN, 4),
+            (False, True): self._make_style(ACCENT_YELLOW, 3),
+        }
+        self._index_landmarks()
+        
+        # Painted extent, grown to fit the content in set_landmarks - the
+        # item cache clips to it, and dots and the spine line at the grid
+        # edge overhang the grid
+        self._bounds = QRectF()
+        
+        # The heatmap beneath repaints every frame; keep the rendered
+        # overlay as a pixmap so it is only redrawn when update() is called
+        self.setCacheMode(pg.QtWidgets.QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        
+        # The highlight moves with the finger while the landmarks only change
+        # with the calibration, so highlighted dots live in a small uncached
+        # child and moving them leaves the pixmap above intact. Labels go in
+        # a second child, added after it so they still draw on top.
+        self._highlight_item = LandmarkHighlight(self)
+        self._label_item = LandmarkLabels(self)
+    
+    @property
+    def show_labels(self) -> bool:
+        return self._label_item.isVisible()
+    
+    @show_labels.setter
+    def show_labels(self, show: bool):
+        # Labels are a separately cached child, so toggle it directly
+        self._label_item.setVisible(show)
+    
+    @staticmethod
+    def _make_style(color_hex: str, size: int) -> Tuple[QPen, QBrush, int]:
+        color = QColor(color_hex)
+        return QPen(color, 1), QBrush(color), size
     
     def set_landmarks(self, landmarks: list, spine_line=None):
+        # Snapshot the fields rather than trusting identity, since callers
+        # may hand back the same list after editing it in place
+        sig = (
+            tuple((lm.level, lm.landmark_type, lm.row, lm.col) for lm in landmarks),
+            spine_line and (spine_line.start_row, spine_line.end_row,
+                            tuple(spine_line.coefficients))
+        )
+        if sig == self._landmarks_sig:
+            return
+        self._landmarks_sig = sig
+        
         self.landmarks = landmarks
         self.spine_line = spine_line
+        self._index_landmarks()
+        self._update_highlight()
+        self._label_item.set_landmarks(landmarks)
+        
+        # Spine endpoints only change with the calibration, not per paint
+        self._spine_qline = None
+        if spine_line:
+            y1 = spine_line.start_row
+            x1 = spine_line.get_col_at_row(y1)
+            y2 = spine_line.end_row
+            x2 = spine_line.get_col_at_row(y2)
+            self._spine_qline = QLine(int(x1), int(y1), int(x2), int(y2))
+        
+        self._update_bounds()
         self.update()
     
+    def _update_bounds(self):
+        """Fit the bounds to the spine line and dots, padded for pen width."""
+        bounds = QRectF()
+        for rect in self._dot_rects[False]:
+            bounds = bounds.united(rect)
+        if self._spine_qline is not None:
+            line = self._spine_qline
+            bounds = bounds.united(QRectF(QPointF(line.p1()), QPointF(line.p2())).normalized())
+        
+        pad = self._spine_pen.widthF()
+        self.prepareGeometryChange()
+        self._bounds = QRectF() if bounds.isNull() else bounds.adjusted(-pad, -pad, pad, pad)
+    
+    def _index_landmarks(self):
+        """Mirror landmark fields into parallel arrays for masked grouping."""
+        n = len(self.landmarks)
+        self._cols = np.fromiter((lm.col for lm in self.landmarks), dtype=np.float64, count=n)
+        self._rows = np.fromiter((lm.row for lm in self.landmarks), dtype=np.float64, count=n)
+        self._is_spinous = np.fromiter(
+            (lm.landmark_type == 'spinous' for lm in self.landmarks), dtype=bool, count=n
+        )
+        self._levels = np.array([lm.level for lm in self.landmarks], dtype=str)
+        self._types = np.array([lm.landmark_type for lm in self.landmarks], dtype=str)
+        
+        # Dot rect for each landmark at its normal and highlighted size,
+        # so paint only picks rects rather than constructing them. The
+        # highlighted dot is drawn over the normal one, so grow it around
+        # the same center to cover it completely.
+        self._dot_rects = {False: [None] * n, True: [None] * n}
+        for is_spinous in (True, False):
+            size = self._styles[(is_spinous, False)][2]
+            grow = (self._styles[(is_spinous, True)][2] - size) / 2
+            idx = np.flatnonzero(self._is_spinous == is_spinous)
+            xs = (self._cols[idx] - size/2).astype(int)
+            ys = (self._rows[idx] - size/2).astype(int)
+            for i, x, y in zip(idx.tolist(), xs.tolist(), ys.tolist()):
+                rect = QRectF(x, y, size, size)
+                self._dot_rects[False][i] = rect
+                self._dot_rects[True][i] = rect.adjusted(-grow, -grow, grow, grow)
+    
     def highlight(self, landmark):
+        # Called every frame; only touch the highlight item when the
+        # highlighted landmark actually changes
+        current = self.highlight_landmark
+        if landmark is current or (
+            landmark and current and
+            landmark.level == current.level and
+            landmark.landmark_type == current.landmark_type
+        ):
+            return
         self.highlight_landmark = landmark
-        self.update()
+        self._update_highlight()
+    
+    def _update_highlight(self):
+        """Hand the dots of the highlighted landmark to the highlight item."""
+        groups = []
+        hl = self.highlight_landmark
+        if hl:
+            highlighted = (self._levels == hl.level) & (self._types == hl.landmark_type)
+            rects = self._dot_rects[True]
+            for (is_spinous, is_highlighted), (pen, brush, _) in self._styles.items():
+                if not is_highlighted:
+                    continue
+                members = np.flatnonzero((self._is_spinous == is_spinous) & highlighted)
+                if len(members):
+                    groups.append((pen, brush, [rects[i] for i in members.tolist()]))
+        self._highlight_item.set_dots(groups)
     
     def boundingRect(self):
-        return pg.QtCore.QRectF(0, 0, GRID_COLS, GRID_ROWS)
+        return self._bounds
+    
+    def dataBounds(self, ax, frac=1.0, orthoRange=None):
+        # Auto-range to the grid, not to the dots overhanging its edge
+        return (0, GRID_COLS) if ax == 0 else (0, GRID_ROWS)
     
     def paint(self, painter, option, widget):
         if not self.landmarks:
@@ -307,59 +760,85 @@ class LandmarkOverlay(pg.GraphicsObject):
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Draw spine line
-        if self.spine_line:
-            pen = QPen(QColor(ACCENT_PURPLE))
-            pen.setWidth(2)
-            pen.setStyle(Qt.PenStyle.DashLine)
-            painter.setPen(pen)
-            
-            y1 = self.spine_line.start_row
-            x1 = self.spine_line.get_col_at_row(y1)
-            y2 = self.spine_line.end_row
-            x2 = self.spine_line.get_col_at_row(y2)
-            
-            painter.drawLine(int(x1), int(y1), int(x2), int(y2))
-        
-        # Draw landmarks
-        for lm in self.landmarks:
-            is_highlighted = (self.highlight_landmark and 
-                            lm.level == self.highlight_landmark.level and
-                            lm.landmark_type == self.highlight_landmark.landmark_type)
-            
-            # Choose color based on type
-            if lm.landmark_type == 'spinous':
-                color = QColor(ACCENT_GREEN) if is_highlighted else QColor(ACCENT_BLUE)
-                size = 4 if is_highlighted else 3
-            else:
-                color = QColor(ACCENT_YELLOW) if is_highlighted else QColor(ACCENT_ORANGE)
-                size = 3 if is_highlighted else 2
+        if self._spine_qline is not None:
+            painter.setPen(self._spine_pen)
+            painter.drawLine(self._spine_qline)
+        
+        # Draw landmarks at their normal size, one style group at a time so
+        # pen and brush change once per group; LandmarkHighlight draws the
+        # highlighted ones on top
+        rects = self._dot_rects[False]
+        for (is_spinous, is_highlighted), (pen, brush, _) in self._styles.items():
+            if is_highlighted:
+                continue
+            members = np.flatnonzero(self._is_spinous == is_spinous)
+            if not len(members):
+                continue
             
-            # Draw filled circle
-            painter.setPen(QPen(color, 1))
-            painter.setBrush(QBrush(color))
-            painter.drawEllipse(
-                int(lm.col - size/2), int(lm.row - size/2),
-                size, size
-            )
-            
-            # Draw label for spinous processes
-            if self.show_labels and lm.landmark_type == 'spinous':
-                painter.setPen(QPen(QColor(DARK_TEXT)))
-                font = painter.font()
-                font.setPointSize(7)
-                painter.setFont(font)
-                painter.drawText(int(lm.col + 3), int(lm.row + 2), lm.level)
+            # Draw filled circles as a single path
+            path = QPainterPath()
+            path.setFillRule(Qt.FillRule.WindingFill)
+            for i in members.tolist():
+                path.addEllipse(rects[i])
+            painter.setPen(pen)
+            painter.setBrush(brush)
+            painter.drawPath(path)
 
 
 # ============================================================================
 # Feedback Panel Widget
 # ============================================================================
 
+class ZoneBar(QProgressBar):
+    """
+    Progress bar whose chunk color is set directly.
+    
+    Recoloring a QProgressBar through its style sheet makes Qt re-parse
+    and re-polish it; here the chunk is painted by hand, matching the
+    dark theme's QProgressBar rules, so a color change is just update().
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._frame_pen = QPen(QColor(DARK_SURFACE), 1)
+        self._background = QBrush(QColor(DARK_BG))
+        self._chunk_brush = QBrush(QColor(ACCENT_BLUE))
+    
+    def set_chunk_color(self, color: QColor):
+        if color != self._chunk_brush.color():
+            self._chunk_brush.setColor(color)
+            self.update()
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Frame and trough
+        painter.setPen(self._frame_pen)
+        painter.setBrush(self._background)
+        painter.drawRoundedRect(QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5), 4, 4)
+        
+        # Filled chunk
+        span = self.maximum() - self.minimum()
+        if span > 0 and self.value() > self.minimum():
+            chunk = QRectF(self.rect()).adjusted(1, 1, -1, -1)
+            chunk.setWidth(chunk.width() * (self.value() - self.minimum()) / span)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(self._chunk_brush)
+            painter.drawRoundedRect(chunk, 3, 3)
+
+
 class FeedbackPanel(QWidget):
     """Panel showing real-time palpation and speed feedback."""
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Last applied zones/style, so stylesheets are only re-parsed on change
+        self._pressure_zone = None
+        self._speed_zone = None
+        self._target_style = YELLOW_TEXT_QSS
+        # Zone color -> (label stylesheet, progress bar chunk color)
+        self._zone_styles = {}
         self._build_ui()
     
     def _build_ui(self):
@@ -370,8 +849,8 @@ class FeedbackPanel(QWidget):
         pressure_group = QGroupBox("Pressure Feedback")
         pressure_layout = QVBoxLayout(pressure_group)
         
-        self.pressure_bar = QProgressBar()
-        self.pressure_bar.setRange(0, 4095)
+        self.pressure_bar = ZoneBar()
+        self.pressure_bar.setRange(0, PRESSURE_DISPLAY_MAX)
         self.pressure_bar.setTextVisible(False)
         pressure_layout.addWidget(self.pressure_bar)
         
@@ -386,7 +865,7 @@ class FeedbackPanel(QWidget):
         speed_group = QGroupBox("Movement Speed")
         speed_layout = QVBoxLayout(speed_group)
         
-        self.speed_bar = QProgressBar()
+        self.speed_bar = ZoneBar()
         self.speed_bar.setRange(0, 100)
         self.speed_bar.setTextVisible(False)
         speed_layout.addWidget(self.speed_bar)
@@ -405,7 +884,7 @@ class FeedbackPanel(QWidget):
         self.target_label = QLabel("Calibrate to enable guidance")
         self.target_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.target_label.setWordWrap(True)
-        self.target_label.setStyleSheet(f"color: {ACCENT_YELLOW};")
+        self.target_label.setStyleSheet(YELLOW_TEXT_QSS)
         target_layout.addWidget(self.target_label)
         
         self.distance_label = QLabel("")
@@ -414,19 +893,28 @@ class FeedbackPanel(QWidget):
         
         layout.addWidget(target_group)
     
+    def _get_zone_style(self, color: str) -> Tuple[str, QColor]:
+        """Label stylesheet and bar color for a zone color, built once."""
+        style = self._zone_styles.get(color)
+        if style is None:
+            style = (ZONE_LABEL_QSS.format(color=color), QColor(color))
+            self._zone_styles[color] = style
+        return style
+    
     def update_pressure(self, value: int):
         """Update pressure display."""
         self.pressure_bar.setValue(value)
         zone_name, color, message = PalpationZones.get_zone(value)
+        if zone_name == self._pressure_zone:
+            return
+        self._pressure_zone = zone_name
+        
+        label_qss, chunk_color = self._get_zone_style(color)
         self.pressure_label.setText(message)
-        self.pressure_label.setStyleSheet(f"color: {color}; font-weight: bold;")
+        self.pressure_label.setStyleSheet(label_qss)
         
         # Color the progress bar
-        self.pressure_bar.setStyleSheet(f"""
-            QProgressBar::chunk {{
-                background-color: {color};
-            }}
-        """)
+        self.pressure_bar.set_chunk_color(chunk_color)
     
     def update_speed(self, speed: float):
         """Update speed display."""
@@ -436,13 +924,13 @@ class FeedbackPanel(QWidget):
         
         zone_name, color, message = SpeedZones.get_zone(speed)
         self.speed_label.setText(f"{message} ({speed:.1f} cells/s)")
-        self.speed_label.setStyleSheet(f"color: {color}; font-weight: bold;")
+        if zone_name == self._speed_zone:
+            return
+        self._speed_zone = zone_name
         
-        self.speed_bar.setStyleSheet(f"""
-            QProgressBar::chunk {{
-                background-color: {color};
-            }}
-        """)
+        label_qss, chunk_color = self._get_zone_style(color)
+        self.speed_label.setStyleSheet(label_qss)
+        self.speed_bar.set_chunk_color(chunk_color)
     
     def update_target(self, feedback: dict):
         """Update target guidance from detector feedback."""
@@ -456,10 +944,14 @@ class FeedbackPanel(QWidget):
         
         if feedback['on_target']:
             self.target_label.setText(f"✓ On {lm.level} {lm.landmark_type}")
-            self.target_label.setStyleSheet(f"color: {ACCENT_GREEN}; font-weight: bold;")
+            style = GREEN_BOLD_QSS
         else:
             self.target_label.setText(feedback['feedback'])
-            self.target_label.setStyleSheet(f"color: {ACCENT_YELLOW}; font-weight: bold;")
+            style = YELLOW_BOLD_QSS
+        
+        if style is not self._target_style:
+            self.target_label.setStyleSheet(style)
+            self._target_style = style
         
         self.distance_label.setText(f"Distance: {dist:.1f} cells")
 
@@ -480,12 +972,16 @@ class GridVisualizerWindow(QMainWindow):
         self.grid_data = np.zeros((GRID_ROWS, GRID_COLS), dtype=np.uint16)
         self.selected_row = GRID_ROWS // 2
         self.selected_col = GRID_COLS // 2
-        self.waveform_history = deque(maxlen=WAVEFORM_HISTORY_SIZE)
+        self.waveform_history = RingBuffer1D(WAVEFORM_HISTORY_SIZE)
+        self._waveform_time = np.arange(WAVEFORM_HISTORY_SIZE, dtype=np.float32) / 25
         self.frame_count = 0
-        self.start_time = time.time()
+        # Frame count and time at the last FPS label refresh
+        self._fps_count = 0
+        self._fps_time = time.time()
         
         # Serial connection
         self.serial_reader: Optional[SerialReader] = None
+        self._serial_seq = 0
         
         # Spine detection
         self.spine_detector = SpineDetector()
@@ -503,63 +999,33 @@ class GridVisualizerWindow(QMainWindow):
         # Demo timer
         self.demo_timer = QTimer()
         self.demo_timer.timeout.connect(self._generate_demo_data)
+        # Row/column index grids that broadcast to the full demo frame
+        self._demo_rows = np.arange(GRID_ROWS)[:, None]
+        self._demo_cols = np.arange(GRID_COLS)[None, :]
+        # Reused each tick; consumers that keep a frame copy it
+        self._demo_work = np.empty((GRID_ROWS, GRID_COLS), dtype=np.float64)
+        self._demo_frame = np.empty((GRID_ROWS, GRID_COLS), dtype=np.uint16)
+        # Generator.integers has no out=, so noise is drawn as floats into
+        # a reused buffer instead
+        self._demo_rng = np.random.Generator(np.random.Philox())
+        self._demo_noise = np.empty((GRID_ROWS, GRID_COLS), dtype=np.float64)
+        
+        # Serial frame poll timer - repaints at display rate, decoupled from
+        # the packet rate. Coarse timers may drift by 5%, enough to beat
+        # against 60 Hz and drop frames.
+        self.serial_timer = QTimer()
+        self.serial_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.serial_timer.timeout.connect(self._poll_serial)
+        
+        # FPS label refresh - once a second is plenty, so let Qt coalesce it
+        self.fps_timer = QTimer()
+        self.fps_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.fps_timer.timeout.connect(self._update_fps)
+        self.fps_timer.start(1000)
     
     def _apply_dark_theme(self):
         """Apply dark color scheme."""
-        self.setStyleSheet(f"""
-            QMainWindow, QWidget {{
-                background-color: {DARK_BG};
-                color: {DARK_TEXT};
-            }}
-            QGroupBox {{
-                border: 1px solid {DARK_SURFACE};
-                border-radius: 8px;
-                margin-top: 12px;
-                padding-top: 10px;
-                font-weight: bold;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }}
-            QPushButton {{
-                background-color: {DARK_SURFACE};
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {ACCENT_BLUE};
-                color: {DARK_BG};
-            }}
-            QPushButton:pressed {{
-                background-color: {ACCENT_GREEN};
-            }}
-            QComboBox {{
-                background-color: {DARK_SURFACE};
-                border: 1px solid {DARK_SURFACE};
-                border-radius: 4px;
-                padding: 5px;
-            }}
-            QLabel {{
-                color: {DARK_TEXT};
-            }}
-            QStatusBar {{
-                background-color: {DARK_SURFACE};
-            }}
-            QProgressBar {{
-                border: 1px solid {DARK_SURFACE};
-                border-radius: 4px;
-                background-color: {DARK_BG};
-                height: 20px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {ACCENT_BLUE};
-                border-radius: 3px;
-            }}
-        """)
+        self.setStyleSheet(DARK_THEME_QSS)
     
     def _build_ui(self):
         """Construct the user interface."""
@@ -579,7 +1045,7 @@ class GridVisualizerWindow(QMainWindow):
         title_layout.addWidget(heatmap_label)
         
         self.calibration_status = QLabel("● Not Calibrated")
-        self.calibration_status.setStyleSheet(f"color: {ACCENT_YELLOW};")
+        self.calibration_status.setStyleSheet(YELLOW_TEXT_QSS)
         title_layout.addWidget(self.calibration_status)
         title_layout.addStretch()
         
@@ -591,27 +1057,17 @@ class GridVisualizerWindow(QMainWindow):
         self.heatmap_widget.hideAxis('left')
         self.heatmap_widget.hideAxis('bottom')
         
-        # Create ImageItem for heatmap
-        self.heatmap_image = pg.ImageItem()
+        # Create ImageItem for heatmap; row-major matches the (row, col)
+        # frames, so they are passed as-is rather than as a transposed view
+        self.heatmap_image = pg.ImageItem(axisOrder='row-major')
         self.heatmap_widget.addItem(self.heatmap_image)
         
         # Set colormap
-        colors = [
-            (0, 0, 128),      # Dark blue
-            (0, 0, 255),      # Blue
-            (0, 255, 255),    # Cyan
-            (0, 255, 0),      # Green
-            (255, 255, 0),    # Yellow
-            (255, 128, 0),    # Orange
-            (255, 0, 0),      # Red
-        ]
-        positions = np.linspace(0, 1, len(colors))
-        colormap = pg.ColorMap(positions, colors)
-        self.heatmap_image.setLookupTable(colormap.getLookupTable())
-        self.heatmap_image.setLevels([0, 4095])
+        self.heatmap_image.setLookupTable(HEATMAP_LUT)
+        self.heatmap_image.setLevels([0, PRESSURE_DISPLAY_MAX])
         
         # Initial empty image
-        self.heatmap_image.setImage(self.grid_data.T)
+        self.heatmap_image.setImage(self.grid_data)
         
         # Add landmark overlay
         self.landmark_overlay = LandmarkOverlay()
@@ -646,9 +1102,12 @@ class GridVisualizerWindow(QMainWindow):
         self.waveform_plot.setBackground(DARK_SURFACE)
         self.waveform_plot.setLabel('left', 'Pressure', units='raw')
         self.waveform_plot.setLabel('bottom', 'Time', units='s')
-        self.waveform_plot.setYRange(0, 4095)
+        self.waveform_plot.setYRange(0, PRESSURE_DISPLAY_MAX)
         self.waveform_plot.showGrid(x=True, y=True, alpha=0.3)
         self.waveform_plot.setMaximumHeight(150)
+        # Only paint visible points, peak-decimated once they outnumber pixels
+        self.waveform_plot.setDownsampling(auto=True, mode='peak')
+        self.waveform_plot.setClipToView(True)
         
         self.waveform_curve = self.waveform_plot.plot(
             pen=pg.mkPen(color=ACCENT_BLUE, width=2)
@@ -657,7 +1116,7 @@ class GridVisualizerWindow(QMainWindow):
         
         self.selected_label = QLabel(f"Selected: Row {self.selected_row}, Col {self.selected_col}")
         self.selected_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.selected_label.setStyleSheet(f"color: {ACCENT_YELLOW}; font-weight: bold;")
+        self.selected_label.setStyleSheet(YELLOW_BOLD_QSS)
         waveform_layout.addWidget(self.selected_label)
         
         right_panel.addWidget(waveform_group)
@@ -683,7 +1142,7 @@ class GridVisualizerWindow(QMainWindow):
         btn_layout = QHBoxLayout()
         self.connect_btn = QPushButton("▶ Connect")
         self.connect_btn.clicked.connect(self._toggle_connection)
-        self.connect_btn.setStyleSheet(f"background-color: {ACCENT_GREEN}; color: {DARK_BG};")
+        self.connect_btn.setStyleSheet(TOGGLE_BUTTON_QSS)
         btn_layout.addWidget(self.connect_btn)
         
         self.demo_btn = QPushButton("🎮 Demo")
@@ -744,10 +1203,11 @@ class GridVisualizerWindow(QMainWindow):
     def _toggle_connection(self):
         """Connect or disconnect from serial port."""
         if self.serial_reader and self.serial_reader.running:
+            self.serial_timer.stop()
             self.serial_reader.stop()
             self.serial_reader = None
             self.connect_btn.setText("▶ Connect")
-            self.connect_btn.setStyleSheet(f"background-color: {ACCENT_GREEN}; color: {DARK_BG};")
+            set_button_active(self.connect_btn, False)
             self.status_bar.showMessage("Disconnected")
         else:
             port = self.port_combo.currentData()
@@ -756,12 +1216,13 @@ class GridVisualizerWindow(QMainWindow):
                 return
             
             self.serial_reader = SerialReader(port)
-            self.serial_reader.data_received.connect(self._on_data_received)
             self.serial_reader.error_occurred.connect(self._on_serial_error)
             self.serial_reader.start()
+            self._serial_seq = 0
+            self.serial_timer.start(FRAME_POLL_INTERVAL_MS)
             
             self.connect_btn.setText("⏹ Disconnect")
-            self.connect_btn.setStyleSheet(f"background-color: {ACCENT_RED}; color: {DARK_BG};")
+            set_button_active(self.connect_btn, True)
             self.status_bar.showMessage(f"Connected to {port}")
     
     def _toggle_demo(self):
@@ -783,19 +1244,43 @@ class GridVisualizerWindow(QMainWindow):
         spine_col = GRID_COLS / 2 + np.sin(t * 0.3) * 3  # Slight lateral movement
         spine_row = 5 + ((t * 3) % 30)  # Move up and down
         
-        # Generate pressure around finger position
-        data = np.zeros((GRID_ROWS, GRID_COLS), dtype=np.uint16)
-        for i in range(GRID_ROWS):
-            for j in range(GRID_COLS):
-                dist = np.sqrt((i - spine_row)**2 + (j - spine_col)**2)
-                # Finger-sized pressure spot with realistic velostat range
-                data[i, j] = int(2000 * np.exp(-dist**2 / 8))
-        
-        # Add noise
-        data = data + np.random.randint(0, 50, data.shape, dtype=np.uint16)
+        # Generate pressure around finger position, in place in the
+        # preallocated buffers
+        work = self._demo_work
+        np.add((self._demo_rows - spine_row)**2, (self._demo_cols - spine_col)**2, out=work)
+        work /= -8
+        np.exp(work, out=work)
+        # Finger-sized pressure spot with realistic velostat range
+        work *= 2000
+        
+        # Add noise (0-50 ADC counts, truncated with the rest on the cast)
+        noise = self._demo_rng.random(out=self._demo_noise)
+        noise *= 50
+        work += noise
+        data = self._demo_frame
+        np.copyto(data, work, casting='unsafe')
         
         self._on_data_received(data)
     
+    def _update_fps(self):
+        """Show the frame rate over the last FPS timer interval."""
+        now = time.time()
+        elapsed = now - self._fps_time
+        if elapsed > 0:
+            fps = (self.frame_count - self._fps_count) / elapsed
+            self.fps_label.setText(f"FPS: {fps:.1f}")
+        self._fps_count = self.frame_count
+        self._fps_time = now
+    
+    def _poll_serial(self):
+        """Pull the newest serial frame, skipping any that went stale."""
+        if not self.serial_reader:
+            return
+        
+        self._serial_seq, data = self.serial_reader.latest_frame(self._serial_seq)
+        if data is not None:
+            self._on_data_received(data)
+    
     def _on_data_received(self, data: np.ndarray):
         """Handle received grid data."""
         self.grid_data = data
@@ -803,7 +1288,7 @@ class GridVisualizerWindow(QMainWindow):
         current_time = time.time()
         
         # Update heatmap
-        self.heatmap_image.setImage(data.T, autoLevels=False)
+        self.heatmap_image.setImage(data, autoLevels=False)
         
         # If calibrating, send frame to dialog
         if self.calibration_dialog and self.calibration_dialog._is_recording:
@@ -813,7 +1298,8 @@ class GridVisualizerWindow(QMainWindow):
         pos, speed = self.movement_tracker.update(data, current_time)
         
         # Update feedback
-        max_pressure = int(np.max(data))
+        # ndarray methods skip np.max/np.mean's generic dispatch wrappers
+        max_pressure = int(data.max())
         self.feedback_panel.update_pressure(max_pressure)
         self.feedback_panel.update_speed(speed)
         
@@ -830,26 +1316,25 @@ class GridVisualizerWindow(QMainWindow):
         
         # Update waveform
         cell_value = data[self.selected_row, self.selected_col]
-        self.waveform_history.append(cell_value)
+        self.waveform_history.push(cell_value)
         
-        if len(self.waveform_history) > 1:
-            time_axis = np.linspace(0, len(self.waveform_history) / 25, len(self.waveform_history))
-            self.waveform_curve.setData(time_axis, list(self.waveform_history))
+        n = len(self.waveform_history)
+        if n > 1:
+            # Ring samples are always finite, so skip pyqtgraph's NaN scan
+            self.waveform_curve.setData(
+                self._waveform_time[:n], self.waveform_history.view(), skipFiniteCheck=True
+            )
         
         # Update stats
-        elapsed = current_time - self.start_time
-        if elapsed > 0:
-            fps = self.frame_count / elapsed
-            self.fps_label.setText(f"FPS: {fps:.1f}")
-        
         self.max_label.setText(f"Max Value: {max_pressure}")
-        self.avg_label.setText(f"Avg Value: {np.mean(data):.0f}")
+        self.avg_label.setText(f"Avg Value: {data.mean():.0f}")
     
     def _on_serial_error(self, error: str):
         """Handle serial errors."""
+        self.serial_timer.stop()
         self.status_bar.showMessage(f"Error: {error}")
         self.connect_btn.setText("▶ Connect")
-        self.connect_btn.setStyleSheet(f"background-color: {ACCENT_GREEN}; color: {DARK_BG};")
+        set_button_active(self.connect_btn, False)
     
     def _on_heatmap_click(self, event):
         """Handle click on heatmap."""
@@ -881,7 +1366,7 @@ class GridVisualizerWindow(QMainWindow):
                 detector.calibration.spine_line
             )
             self.calibration_status.setText("✓ Calibrated")
-            self.calibration_status.setStyleSheet(f"color: {ACCENT_GREEN};")
+            self.calibration_status.setStyleSheet(GREEN_TEXT_QSS)
             self.status_bar.showMessage("Calibration complete! Landmarks visible on heatmap")
         
         self.calibration_dialog = None
@@ -911,7 +1396,7 @@ class GridVisualizerWindow(QMainWindow):
                     self.spine_detector.calibration.spine_line
                 )
                 self.calibration_status.setText("✓ Calibrated")
-                self.calibration_status.setStyleSheet(f"color: {ACCENT_GREEN};")
+                self.calibration_status.setStyleSheet(GREEN_TEXT_QSS)
                 self.status_bar.showMessage(f"Calibration loaded from {filepath}")
             else:
                 self.status_bar.showMessage("Failed to load calibration")
@@ -920,7 +1405,9 @@ class GridVisualizerWindow(QMainWindow):
         """Clean up on window close."""
         if self.serial_reader:
             self.serial_reader.stop()
+        self.serial_timer.stop()
         self.demo_timer.stop()
+        self.fps_timer.stop()
         event.accept()
 
 
@@ -51,6 +51,26 @@ class PalpationZones:
         
         Returns: (zone_name, color_hex, feedback_message)
         """
+        if isinstance(value, int) and value >= 0:
+            table = PalpationZones._zone_table
+            # Anything past the end is 'excessive', like the last entry
+            return table[value] if value < len(table) else table[-1]
+        return PalpationZones._classify(value)
+    
+    @classmethod
+    def rebuild_zone_table(cls):
+        """
+        Rebuild the zone lookup table from the current thresholds.
+        
+        The table is built once at import; call this after changing any
+        threshold, or integer pressures keep getting the old zones.
+        """
+        # Every integer pressure up to just past TOO_HARD; above that is
+        # always 'excessive'
+        cls._zone_table = tuple(cls._classify(v) for v in range(cls.TOO_HARD + 2))
+    
+    @staticmethod
+    def _classify(value: float) -> Tuple[str, str, str]:
         if value < PalpationZones.MIN_CONTACT:
             return ("no_contact", "#666666", "No contact detected")
         elif value < PalpationZones.LIGHT_TOUCH:
@@ -65,6 +85,11 @@ class PalpationZones:
             return ("excessive", "#f38ba8", "⚠ Too hard - reduce pressure")
 
 
+# Zone for every integer pressure the GUI passes in each frame, so
+# get_zone() is a single lookup
+PalpationZones.rebuild_zone_table()
+
+
 @dataclass
 class SpeedZones:
     """
@@ -262,7 +287,10 @@ class SpineDetector:
     
     def __init__(self):
         self.calibration = SpineCalibration()
-        self._calibration_frames: List[np.ndarray] = []
+        # Running per-cell maximum of the calibration drag; the frames
+        # themselves are not kept
+        self._calibration_max: Optional[np.ndarray] = None
+        self._calibration_frame_count = 0
         self._is_calibrating = False
         
         # Kalman filters for each landmark (initialized after calibration)
@@ -270,7 +298,8 @@ class SpineDetector:
     
     def start_calibration(self):
         """Begin calibration mode."""
-        self._calibration_frames = []
+        self._calibration_max = None
+        self._calibration_frame_count = 0
         self._is_calibrating = True
         self.calibration = SpineCalibration()
     
@@ -280,7 +309,10 @@ class SpineDetector:
         Call this for each frame while user drags finger along spine.
         """
         if self._is_calibrating:
-            self._calibration_frames.append(frame.copy())
+            if self._calibration_max is None:
+                self._calibration_max = np.zeros(frame.shape, dtype=float)
+            np.maximum(self._calibration_max, frame, out=self._calibration_max)
+            self._calibration_frame_count += 1
     
     def finalize_calibration(self) -> Tuple[bool, str]:
         """
@@ -291,8 +323,8 @@ class SpineDetector:
         """
         self._is_calibrating = False
         
-        if len(self._calibration_frames) < self.MIN_CALIBRATION_FRAMES:
-            return (False, f"Not enough frames ({len(self._calibration_frames)} < {self.MIN_CALIBRATION_FRAMES})")
+        if self._calibration_frame_count < self.MIN_CALIBRATION_FRAMES:
+            return (False, f"Not enough frames ({self._calibration_frame_count} < {self.MIN_CALIBRATION_FRAMES})")
         
         # Detect spine line from pressure trail
         spine_line = self._detect_spine_line()
@@ -322,29 +354,23 @@ class SpineDetector:
         2. Collect points with significant pressure
         3. Fit line through points using least squares
         """
-        # Combine all frames - take maximum at each cell
-        combined = np.zeros_like(self._calibration_frames[0], dtype=float)
-        for frame in self._calibration_frames:
-            combined = np.maximum(combined, frame)
-        
-        # For each row, find column centroid weighted by pressure
-        trail_points = []
-        for row in range(combined.shape[0]):
-            row_values = combined[row, :]
-            
-            if np.max(row_values) > self.MIN_CALIBRATION_PRESSURE:
-                # Weighted centroid
-                total_weight = np.sum(row_values)
-                if total_weight > 0:
-                    col_centroid = np.sum(np.arange(len(row_values)) * row_values) / total_weight
-                    trail_points.append((row, col_centroid))
-        
-        if len(trail_points) < 10:
+        # All frames combined - maximum at each cell, accumulated as they arrived
+        combined = self._calibration_max
+        
+        # For each row, find column centroid weighted by pressure - all rows
+        # at once from per-row reductions
+        row_max = combined.max(axis=1)
+        total_weight = combined.sum(axis=1)
+        weighted_cols = combined @ np.arange(combined.shape[1])
+        
+        # Keep rows with significant pressure
+        trail = (row_max > self.MIN_CALIBRATION_PRESSURE) & (total_weight > 0)
+        rows = np.flatnonzero(trail)
+        
+        if len(rows) < 10:
             return None
         
-        # Extract arrays
-        rows = np.array([p[0] for p in trail_points])
-        cols = np.array([p[1] for p in trail_points])
+        cols = weighted_cols[trail] / total_weight[trail]
         
         # Fit line: col = slope * row + intercept
         coefficients = np.polyfit(rows, cols, deg=1)
@@ -559,15 +585,17 @@ class MovementTracker:
         Returns:
             (centroid_position, speed_cells_per_second)
         """
-        # Find centroid of pressure
-        total = np.sum(frame)
+        # Find centroid of pressure from the row/column marginals rather
+        # than two full index-weighted grids
+        row_sums = frame.sum(axis=1)
+        col_sums = frame.sum(axis=0)
+        total = row_sums.sum()
         if total < 100:  # No significant pressure
             return (None, 0.0)
         
         # Weighted centroid
-        rows, cols = np.indices(frame.shape)
-        row_centroid = np.sum(rows * frame) / total
-        col_centroid = np.sum(cols * frame) / total
+        row_centroid = np.arange(len(row_sums)) @ row_sums / total
+        col_centroid = np.arange(len(col_sums)) @ col_sums / total
         
         pos = (row_centroid, col_centroid)
         